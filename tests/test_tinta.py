@@ -33,7 +33,9 @@ from pytest import CaptureFixture
 from tinta import Tinta
 
 # pylint: disable=import-error
-from tinta.stylize import _join, ansi_styles
+from tinta.stylize import _join, ansi_styles, ensure_reset, was_reset
+from tinta.tinta import esc
+from tinta.typ import InvalidStyleError
 
 Tinta.load_colors("examples/colors.ini")
 
@@ -118,6 +120,67 @@ class TestInit:
             Tinta.load_colors(clobber_colors_ini)
             assert Tinta().grey("grey").to_str() == f"\x1b[38;5;242mgrey{O}"
 
+    def test_reload_replaces_color_methods(self, alt_colors_ini):
+        Tinta.load_colors(alt_colors_ini)
+        assert Tinta().sparkle("sparkle").to_str() == f"\x1b[38;5;195msparkle{O}"
+        assert "sparkle" in vars(Tinta)
+        with pytest.raises(AttributeError):
+            Tinta().green("green")
+
+        Tinta.load_colors("examples/colors.ini")
+        assert Tinta().green("green").to_str() == f"{GREEN}green{O}"
+        assert "sparkle" not in vars(Tinta)
+
+    def test_reload_colors_from_subclass(self, alt_colors_ini):
+        class Sub(Tinta):
+            pass
+
+        Tinta()
+        Sub.load_colors("examples/colors.ini")
+        assert Sub().green("green").to_str() == f"{GREEN}green{O}"
+
+        Sub.load_colors(alt_colors_ini)
+        assert Sub().sparkle("sparkle").to_str() == f"\x1b[38;5;195msparkle{O}"
+        with pytest.raises(AttributeError):
+            Tinta().green("green")
+
+        Tinta.load_colors("examples/colors.ini")
+        assert Sub().green("green").to_str() == f"{GREEN}green{O}"
+
+    def test_color_methods_accept_tint_kwargs(self):
+        # Installed color methods and the __getattr__ fallback, used until
+        # the reloaded palette is checked, take the same arguments
+        Tinta.load_colors("examples/colors.ini")
+        t = Tinta()
+        assert "red" in vars(Tinta)
+        t.red("x", color="blue").red("y", "z", sep="-")
+        Tinta.load_colors("examples/colors.ini")
+        assert "red" not in vars(Tinta)
+        t.red("x", color="blue").red("y", "z", sep="-")
+        assert t.to_str() == f"{BLUE}x {RED}y-z-{BLUE}x {RED}y-z{O}"
+
+    def test_reload_picks_up_edited_colors(self, alt_colors_ini):
+        alt_colors_ini.write_text("[colors]\nsparkle = 196\n")
+        mtime = os.stat(alt_colors_ini).st_mtime_ns + 1_000_000_000
+        os.utime(alt_colors_ini, ns=(mtime, mtime))
+        Tinta.load_colors(alt_colors_ini)
+        assert Tinta._colors.color_dict == {"sparkle": 196}
+
+    def test_reload_picks_up_edit_with_same_mtime(self, alt_colors_ini):
+        # Coarse filesystem timestamps can leave mtime unchanged after an edit
+        st = os.stat(alt_colors_ini)
+        alt_colors_ini.write_text("[colors]\nsparkle = 21\nunicorn = 213\n")
+        os.utime(alt_colors_ini, ns=(st.st_atime_ns, st.st_mtime_ns))
+        Tinta.load_colors(alt_colors_ini)
+        assert Tinta._colors.color_dict == {"sparkle": 21, "unicorn": 213}
+
+    def test_missing_color_raises(self):
+        with pytest.raises(AttributeError, match="'not_a_color' not found"):
+            Tinta().not_a_color("nope")
+        with pytest.raises(AttributeError, match="no attribute '_private'"):
+            Tinta()._private
+        assert not hasattr(Tinta(), "__not_a_dunder__")
+
 
 class TestBasicColorizing:
 
@@ -483,6 +546,12 @@ class TestEdgeCases:
         with pytest.raises(Exception):
             Tinta().load_colors("tests/test_colors_invalid.ini")
 
+    def test_invalid_styles(self):
+        with pytest.raises(InvalidStyleError):
+            Tinta(styles=["not_a_style"])
+        with pytest.raises(InvalidStyleError):
+            Tinta(styles=[["bold"]])  # type: ignore
+
     def test_print_empty(self):
         Tinta().print()
 
@@ -492,6 +561,30 @@ class TestEdgeCases:
     def test_print_none(self):
         Tinta(None).print()
 
+    def test_print_writes_once(self):
+        class _Out:
+            def __init__(self):
+                self.writes: List[str] = []
+                self.flushed = False
+
+            def write(self, s: str):
+                self.writes.append(s)
+
+            def flush(self):
+                self.flushed = True
+
+        out = _Out()
+        Tinta().green("green").print(end="!", file=out, flush=True)
+        assert out.writes == [f"{GREEN}green{O}!"]
+        assert out.flushed
+
+    def test_print_without_stdout(self, monkeypatch: pytest.MonkeyPatch):
+        # e.g. pythonw, where sys.stdout (and so print's default file) is None
+        monkeypatch.setattr("sys.stdout", None)
+        t = Tinta("x").red("y")
+        t.print(file=None)
+        assert t.parts == []
+
     def test_empty_color_call(self):
         t = Tinta("Plain").green()
         t.push("Green")
@@ -689,6 +782,17 @@ class TestMultipleInstances:
         t.print()
         assert t.blue("Blue").to_str() == f"{BLUE}Blue{O}"
 
+    def test_same_instance_resets_after_stealth_print(
+        self, monkeypatch: pytest.MonkeyPatch, capfd: CaptureFixture[str]
+    ):
+        monkeypatch.setattr("tinta.tinta.STEALTH", True)
+        t = Tinta()
+        t.red("Red").print()
+        assert capfd.readouterr().out == ""
+        assert t.green("Green").to_str() == f"{GREEN}Green{O}"
+        t.print(force=True)
+        assert capfd.readouterr().out == f"{GREEN}Green{O}\n"
+
     def test_multiple_instances_dont_interfere(self):
         t1 = Tinta()
         t2 = Tinta()
@@ -806,6 +910,13 @@ class TestComplexStructure:
             == 3
         )
 
+    def test_has_formatting(self):
+        assert not Tinta().has_formatting
+        assert not Tinta("plain").push("text").has_formatting
+        assert Tinta().green("green").has_formatting
+        assert Tinta("plain").green("green").has_formatting
+        assert Tinta("plain").bold("bold").normal("plain").has_formatting
+
     def test_f_strings(self):
         dog = "cat"
         assert (
@@ -881,6 +992,26 @@ class TestComplexStructure:
         t.pop(2)
         assert t._styler == Tinta.Styler(color=RED)
 
+    def test_push_keeps_earlier_styles(self):
+        t = Tinta().green("green")("still green")
+        assert t.parts[0].styler == t.parts[1].styler
+        t.bold("bold").red("red")
+        assert t.parts[1].style == []
+        assert t.parts[1].color == "green"
+        assert t.to_str() == f"{GREEN}green still green {BOLD}bold {RED}red{O}"
+
+    def test_push_after_current_part_placeholder(self):
+        t = Tinta().red("x")
+        t.parts.clear()
+        t.current_part
+        t.push("y")
+        assert t.to_str() == f"{RED}y{O}"
+
+    def test_color_none_is_no_color(self):
+        t = Tinta("a", color=None).red("b")
+        assert t.parts[0].color_code == 0
+        assert t.to_str() == f"a {RED}b{O}"
+
     def test_tint_handles_zero(self):
         s = (
             Tinta("white")
@@ -924,6 +1055,57 @@ class TestUtils:
     def test_strip_ansi(self, Testa: Callable, expected: str):
         assert Tinta.strip_ansi(Testa().to_str()) == expected
 
+    def test_strip_ansi_long_string(self):
+        t = Tinta()
+        for i in range(50):
+            t.red(str(i)).green(str(i))
+        expected = " ".join(f"{i} {i}" for i in range(50))
+        assert Tinta.strip_ansi(t.to_str()) == expected
+
+    @pytest.mark.parametrize(
+        "s, expected",
+        [
+            (f"{GREEN}green{O}", f"{GREEN}green{O}"),
+            (f"{GREEN}green{O}  \n", f"{GREEN}green{O}  \n"),
+            (f"{GREEN}green", f"{GREEN}green{O}"),
+            (f"{GREEN}green \n", f"{GREEN}green{O} \n"),
+        ],
+    )
+    def test_ensure_reset(self, s: str, expected: str):
+        assert ensure_reset(s) == expected
+        assert was_reset(expected)
+
+    @pytest.mark.parametrize(
+        "s",
+        [
+            f"{GREEN}green{O}",
+            "C:\\path\\to\\file",
+            "tab\tnewline\nreturn\r",
+            "it's a \"quoted\" string \x07\x7f",
+            "I ♡ Unicorns 🦄",
+            "non\xa0breaking",
+            "zero\u200bwidth",
+            f"{GREEN}x\xa0y\u200b{O}",
+        ],
+    )
+    def test_esc_matches_repr(self, s: str):
+        assert esc(s) == repr(s)[1:-1]
+
+    def test_to_str_escape_ansi(self):
+        t = Tinta().green("green").red("red")
+        assert t.to_str(escape_ansi=True) == "\\x1b[38;5;35mgreen \\x1b[38;5;1mred\\x1b[0m"
+        assert Tinta("x\xa0y\u200b").to_str(escape_ansi=True) == "x\\xa0y\\u200b"
+
+    def test_to_str_escape_ansi_per_part(self):
+        t = Tinta("it's").green('"x"')
+        assert t.to_str(escape_ansi=True) == "it's \\x1b[38;5;35m\"x\"\\x1b[0m"
+
+        # Separators are added as-is, not escaped
+        t = Tinta().green("a", sep="\n").red("b")
+        assert t.to_str(escape_ansi=True) == (
+            "\\x1b[38;5;35ma\n\\x1b[38;5;1mb\\x1b[0m"
+        )
+
     @pytest.mark.parametrize(
         "Testa, ljust, fillchar, expected",
         [
@@ -14,27 +14,38 @@
 """This class is a low-level helper class for managing colors in Tinta."""
 
 import configparser
+import functools
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 from .stylize import ansi_color_to_int, is_ansi_str
 from .typ import MissingColorError
 
-colors_ini = configparser.ConfigParser()
-
 
 def _alias_keys(colors: "Union[AnsiColors, Type[AnsiColors]]", search: str, repl: str):
     """Sets up an alias key for a color."""
 
-    for k in (k for k in colors_ini["colors"].keys() if search.lower() in k.lower()):
+    color_dict = colors._color_dict
+    for k in [k for k in color_dict if search.lower() in k.lower()]:
         alias_key = k.replace(search.lower(), repl.lower())
-        if (
-            alias_key not in colors_ini["colors"]
-            and alias_key not in colors._color_dict
-        ):
-            colors._color_dict[alias_key] = int(colors_ini["colors"][k])
-            colors_ini["colors"][alias_key] = colors_ini["colors"][k]
+        if alias_key not in color_dict:
+            color_dict[alias_key] = color_dict[k]
+
+
+@functools.lru_cache(maxsize=8)
+def _read_colors_ini(
+    path: str, stat_key: Tuple[int, int, int]
+) -> Tuple[Tuple[str, int], ...]:
+    """Parses the [colors] section of a colors.ini file. Cached on the file's
+    path plus (inode, size, mtime), so reloading an unchanged palette is free.
+    Size and inode catch edits and replacements that coarse mtimes miss."""
+
+    colors_ini = configparser.ConfigParser()
+    colors_ini["colors"] = {}
+    colors_ini.read(path)
+    return tuple((k, int(v)) for (k, v) in colors_ini["colors"].items())
 
 
 def _check_path(path: Optional[Union[str, Path]] = None):
@@ -81,6 +92,7 @@ class AnsiColors:
     _initialized = False
     _colors_ini_path = None
     _color_dict: Dict[str, int] = {}
+    _code_dict: Dict[int, str] = {}
 
     def __init__(self, path: Optional[Union[str, Path]] = None):
 
@@ -95,13 +107,21 @@ class AnsiColors:
     def load_colors(cls, path: Union[str, Path]):
         """Loads colors from a file."""
 
-        colors_ini["colors"] = {}
-        colors_ini.read(path)
-        cls._color_dict = {k: int(v) for (k, v) in colors_ini["colors"].items()}
+        try:
+            st = os.stat(path)
+            stat_key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        except OSError:
+            stat_key = (-1, -1, -1)
+        cls._color_dict = dict(_read_colors_ini(str(path), stat_key))
 
         _alias_keys(cls, "gray", "grey")
         _alias_keys(cls, "grey", "gray")
 
+        # Reverse lookup for reverse_get; the first name defined for a code wins
+        cls._code_dict = {}
+        for k, v in cls._color_dict.items():
+            cls._code_dict.setdefault(v, k)
+
     def get(self, color: str) -> int:
         """Returns the ANSI code for a color.
 
@@ -115,13 +135,14 @@ class AnsiColors:
         if color == "default":
             return 0
 
+        code = self._color_dict.get(color)
+        if code is not None:
+            return code
+
         if is_ansi_str(color):
             return ansi_color_to_int(color)
 
-        if color not in self._color_dict:
-            raise MissingColorError(f"Color '{color}' not found in colors.ini.")
-
-        return self._color_dict[color]
+        raise MissingColorError(f"Color '{color}' not found in colors.ini.")
 
     def reverse_get(self, code: int, ignore_errors: bool = False) -> str:
         """Returns the color name for an ANSI code.
@@ -137,9 +158,8 @@ class AnsiColors:
         if code == 0:
             return "default"
 
-        for k, v in self._color_dict.items():
-            if v == code:
-                return k
+        if code in self._code_dict:
+            return self._code_dict[code]
 
         if not ignore_errors:
             raise MissingColorError(
@@ -156,6 +176,4 @@ class AnsiColors:
     @property
     def color_dict(self) -> Dict[str, int]:
         """Returns a dictionary of all colors in the colors.ini file."""
-        if not self._color_dict:
-            self._color_dict = {k: int(v) for (k, v) in colors_ini["colors"].items()}
         return self._color_dict
@@ -18,6 +18,7 @@
 # distributed under the same license as the original module, as well as the
 # MIT License.
 
+import functools
 import re
 from typing import (
     Any,
@@ -30,22 +31,39 @@ from typing import (
     Union,
 )
 
-from .constants import ANSI_RESET, ANSI_RESET_OCT, ANSI_STYLES, ANSI_STYLES_OFF, SEP
+from .constants import ANSI_RESET, ANSI_STYLES, ANSI_STYLES_OFF, SEP
 from .typ import InvalidStyleError
 
 if TYPE_CHECKING:
     from .tinta import Tinta
 
+# Bit flags for each style, used by Tinta.Styler to store active styles as an int
+_STYLE_BITS = {name: 1 << i for i, name in enumerate(ANSI_STYLES)}
+
+# (on, off) SGR codes for each style, so lookups don't rescan ANSI_STYLES_OFF
+_STYLE_CODES = {
+    name: (i + 1, next((c for names, c in ANSI_STYLES_OFF if name in names), 0))
+    for i, name in enumerate(ANSI_STYLES)
+}
+
+_HEX6_RE = re.compile("#([a-f0-9]{6})$")
+_HEX3_RE = re.compile("#([a-f0-9]{3})$")
+_RGB_RE = re.compile(r"rgb\((\d+,\d+,\d+)\)")
+
 
 def was_reset(s: str) -> bool:
-    return s.strip().endswith(ANSI_RESET) or s.endswith(ANSI_RESET_OCT)
+    # Fast path: only copy the string to strip it when it doesn't already
+    # end in a reset.
+    return s.endswith(ANSI_RESET) or s.rstrip().endswith(ANSI_RESET)
 
 
 def ensure_reset(s: str, np: "Union[Tinta.Part, None]" = None) -> str:
-    if was_reset(s) or (np and np.has_formatting):
+    if s.endswith(ANSI_RESET) or (np and np.has_formatting):
         return s
-    last_char_idx = len(s.rstrip())
-    return f"{s[:last_char_idx]}{ANSI_RESET}{s[last_char_idx:]}"
+    head = s.rstrip()
+    if head.endswith(ANSI_RESET):
+        return s
+    return f"{head}{ANSI_RESET}{s[len(head):]}"
 
 
 def _parse_rgb(s: str) -> Tuple[int, ...]:
@@ -54,18 +72,18 @@ def _parse_rgb(s: str) -> Tuple[int, ...]:
     s = s.strip().replace(" ", "").lower()
 
     # 6-digit hex
-    match = re.match("#([a-f0-9]{6})$", s)
+    match = _HEX6_RE.match(s)
     if match:
         core = match.group(1)
         return tuple(int(core[i : i + 2], 16) for i in range(0, 6, 2))
 
     # 3-digit hex
-    match = re.match("#([a-f0-9]{3})$", s)
+    match = _HEX3_RE.match(s)
     if match:
         return tuple(int(c * 2, 16) for c in match.group(1))
 
     # rgb(x,y,z)
-    match = re.match(r"rgb\((\d+,\d+,\d+)\)", s)
+    match = _RGB_RE.match(s)
     if match:
         return tuple(int(v) for v in match.group(1).split(","))
 
@@ -127,12 +145,18 @@ def _style_name(code: int) -> str:
         raise InvalidStyleError(f"Invalid style code '{code}'") from e
 
 
+def _style_names(styles: int) -> List[str]:
+    """Returns the style names set in a style bitmask, in ANSI_STYLES order."""
+    return [st for st, bit in _STYLE_BITS.items() if styles & bit]
+
+
 def _style_codes(style: Union[str, int]) -> Tuple[int, int]:
     if isinstance(style, str):
         style = style.lower()
-    on = ANSI_STYLES.index(style) + 1
-    off = next((c for i, c in ANSI_STYLES_OFF for s in i if s == style), 0)
-    return on, off
+    try:
+        return _STYLE_CODES[style]  # type: ignore[index]
+    except KeyError:
+        raise ValueError(f"{style!r} is not a valid style") from None
 
 
 def ansi_styles(style: Union[str, int]) -> Tuple[str, str]:
@@ -150,9 +174,20 @@ def ansi_styles(style: Union[str, int]) -> Tuple[str, str]:
 
 def validate_styles(*styles: Union[int, str]) -> Tuple[str, ...]:
     """Validates a list of style names. If a style is not found in the ANSI
-    styles, it is removed from the list.
+    styles, it is removed from the list. Cached, since the same few styles
+    are validated on every bold(), underline(), etc.
     """
 
+    try:
+        return _validate_styles_cached(*styles)
+    except TypeError:
+        # An unhashable style (e.g. a nested list) can't be a cache key, and
+        # is never valid, so let the uncached check raise InvalidStyleError
+        return _validate_styles(*styles)
+
+
+def _validate_styles(*styles: Union[int, str]) -> Tuple[str, ...]:
+
     _styles: List[Union[int, str]] = list(styles)
 
     if next((isinstance(s, int) for s in styles), False):
@@ -168,6 +203,9 @@ def validate_styles(*styles: Union[int, str]) -> Tuple[str, ...]:
     return cast(Tuple[str, ...], tuple(_styles))
 
 
+_validate_styles_cached = functools.lru_cache(maxsize=128)(_validate_styles)
+
+
 @overload
 def tint(
     instance: "Tinta", *s: Any, color: Union[str, int], sep: str = SEP
@@ -238,42 +276,77 @@ def stylize(
     if not mp:
         return s
 
-    # On
-    on = ""
-    if mp.has_formatting:
-        if not lp or not lp.has_formatting:
-            on = _join(*[_style_codes(st)[0] for st in mp.style])
-        else:
-            if mp.style != lp.style:
-                on = _join(
-                    *[_style_codes(st)[0] for st in mp.style if st not in lp.style]
-                )
-        if mp.color_code and (not lp or (mp.color_code != lp.color_code)):
-            on = _join(on, _color_code(mp.color_code, 30))
+    # Unstyled parts never get a frame, whatever their neighbours look like
+    styler = mp.styler
+    if not (styler.color_code or styler._styles):
+        return s
 
-    # Off
-    off = ""
-    if mp.has_formatting:
-        if (
-            not np
-            or not np.has_formatting
-            or mp.styler.force_clear
-            or bool(mp.style and not np.style and mp.color_code != np.color_code)
-        ):
-            off = "0"
-        elif mp.style != np.style:
-            styles_not_in_n = [s for s in mp.style if s not in np.style]
-            off = _join(*sorted({_style_codes(st)[1] for st in styles_not_in_n}))
-
-    # Apply formatting
-    left = f"\x1b[{on}m" if on else ""
-    right = f"\x1b[{off}m" if off else ""
+    left, right = _ansi_frame(
+        lp.styler._key() if lp else None,
+        styler._key(),
+        np.styler._key() if np else None,
+        styler.force_clear,
+    )
+
+    # e.g. the middle of a run of parts that share the same style
+    if not (left or right):
+        return s
 
     last_char_idx = len(s.rstrip())
 
     return f"{left}{s[:last_char_idx]}{right}{s[last_char_idx:]}"
 
 
+@functools.lru_cache(maxsize=512)
+def _ansi_frame(
+    lp: Optional[Tuple[int, int]],
+    mp: Tuple[int, int],
+    np: Optional[Tuple[int, int]],
+    force_clear: bool = False,
+) -> Tuple[str, str]:
+    """Computes the ANSI codes that open and close a part. The result only
+    depends on the (color code, style bitmask) keys of a part and its
+    neighbours, so it is cached and shared by identical style transitions.
+
+    Args:
+        lp (Tuple[int, int]): The previous part's key, or None.
+        mp (Tuple[int, int]): The current (middle) part's key.
+        np (Tuple[int, int]): The next part's key, or None.
+        force_clear (bool): If True, always close the part with a full reset.
+
+    Returns:
+        Tuple[str, str]: The opening and closing ANSI escape sequences.
+    """
+
+    mp_code, mp_styles = mp
+    if not (mp_code or mp_styles):
+        return "", ""
+
+    # On
+    on = ""
+    if not lp or not any(lp):
+        on = _join(*[_style_codes(st)[0] for st in _style_names(mp_styles)])
+    elif mp_styles != lp[1]:
+        on = _join(*[_style_codes(st)[0] for st in _style_names(mp_styles & ~lp[1])])
+    if mp_code and (not lp or mp_code != lp[0]):
+        on = _join(on, _color_code(mp_code, 30))
+
+    # Off
+    off = ""
+    if (
+        not np
+        or not any(np)
+        or force_clear
+        or bool(mp_styles and not np[1] and mp_code != np[0])
+    ):
+        off = "0"
+    elif mp_styles != np[1]:
+        styles_not_in_n = _style_names(mp_styles & ~np[1])
+        off = _join(*sorted({_style_codes(st)[1] for st in styles_not_in_n}))
+
+    return f"\x1b[{on}m" if on else "", f"\x1b[{off}m" if off else ""
+
+
 def is_ansi_str(s: str) -> bool:
     return s.startswith("\x1b[") or s.startswith("\033[")
 
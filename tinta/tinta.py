@@ -16,17 +16,14 @@ colors and with rich formatting, like bold and underline. It's so pretty,
 it's almost like a unicorn.
 """
 
-import configparser
-import functools
 import os
 import re
 import sys
 from pathlib import Path
-from typing import Any, List, Optional, overload, Sequence, Union
+from typing import Any, Iterator, List, Optional, overload, Sequence, Tuple, Union
 
 from .ansi import AnsiColors
 from .constants import (
-    ANSI_STYLES,
     CURSOR_UP_ONE,
     ERASE_LINE,
     PREFER_PLAINTEXT,
@@ -36,16 +33,34 @@ from .constants import (
     STEALTH,
 )
 from .discover import discover as _discover
-from .stylize import _join, ensure_reset, is_ansi_str, stylize, tint
-from .typ import copy_kwargs, MissingColorError, StringType
+from .stylize import (
+    _join,
+    _STYLE_BITS,
+    _style_names,
+    is_ansi_str,
+    stylize,
+    tint,
+    validate_styles,
+)
+from .typ import MissingColorError
+
+_LINESEP = os.linesep
+_CLEARLINE = CURSOR_UP_ONE + ERASE_LINE
+_PUNC_SET = frozenset(PUNC)
+
+_ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
-config = configparser.ConfigParser()
+# Maps backslashes and control characters to the escape sequences repr() uses
+_ESC_TABLE = {c: f"\\x{c:02x}" for c in (*range(0x20), *range(0x7F, 0xA0))}
+_ESC_TABLE.update(str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}))
 
 
 class _MetaTinta(type):
 
     _initialized = False
     _colors: AnsiColors
+    _colors_checked = False
+    _color_methods: Tuple[str, ...] = ()
 
     def __init__(cls, name, bases, dct):
         super(_MetaTinta, cls).__init__(name, bases, dct)
@@ -56,7 +71,46 @@ class _MetaTinta(type):
 
     def load_colors(cls, path: Union[str, Path]):
         AnsiColors._initialized = False
-        cls._colors = AnsiColors(path)
+        # The palette and its color methods live on Tinta itself (see
+        # __init__), so a subclass reloads them there too
+        for c in Tinta._color_methods:
+            delattr(Tinta, c)
+        Tinta._color_methods = ()
+        Tinta._colors = AnsiColors(path)
+        Tinta._colors_checked = False
+
+    def _check_colors(cls):
+        """Installs a method on the class for each color in the palette, so
+        e.g. Tinta().red() is a plain method lookup. A color named like an
+        existing attribute would clobber it, so that raises instead. Runs once
+        per palette; until then, colors resolve via Tinta.__getattr__."""
+
+        for c in cls._colors.color_dict:
+            if hasattr(cls, c):
+                raise AttributeError(
+                    f"Cannot overwrite built-in method '{c}' with color name. \
+                    Please rename the color in '{cls._colors._colors_ini_path}'."
+                )
+        for c in cls._colors.color_dict:
+            setattr(cls, c, _color_method(c))
+        cls._color_methods = tuple(cls._colors.color_dict)
+        cls._colors_checked = True
+
+
+def _color_method(name: str):
+    """Returns a Tinta method that adds segments of text in color 'name'."""
+
+    # Equivalent to self.tint(*s, color=name, sep=sep), minus tint()'s
+    # argument parsing, which a known color name doesn't need. Any other
+    # keyword arguments (e.g. color=) are still handed to tint().
+    def color_method(self: "Tinta", *s: Any, sep: str = SEP, **kwargs) -> "Tinta":
+        if kwargs:
+            return self.tint(*s, **{"color": name, "sep": sep, **kwargs})
+        self._styler.set_color(name)
+        return self.push(*s, sep=sep)
+
+    color_method.__name__ = name
+    return color_method
 
 
 class Tinta(metaclass=_MetaTinta):
@@ -120,16 +174,8 @@ class Tinta(metaclass=_MetaTinta):
         self._parts: List["Tinta.Part"] = []
         self._prefixes: List[str] = []
 
-        # Inject ANSI helper functions
-        for c in Tinta._colors.color_dict:
-            if hasattr(self, c) and not str(getattr(self, c)).startswith(
-                "functools.partial(<bound method Tinta.tint"
-            ):
-                raise AttributeError(
-                    f"Cannot overwrite built-in method '{c}' with color name. \
-                    Please rename the color in '{Tinta._colors._colors_ini_path}'."
-                )
-            setattr(self, c, functools.partial(self.tint, color=c))
+        if not Tinta._colors_checked:
+            Tinta._check_colors()
 
         if s:
             self.push(*s, sep=sep)
@@ -167,35 +213,34 @@ class Tinta(metaclass=_MetaTinta):
 
     def _get_str(
         self,
-        attr: StringType,
-        lp: Optional["Tinta.Part"],
+        s: str,
         mp: "Tinta.Part",
         np: Optional["Tinta.Part"],
         sep: Optional[str] = None,
         fix_punc: bool = SMART_FIX_PUNCTUATION,
     ) -> str:
-
-        s: str = (
-            mp.pln
-            if attr == "pln"
-            else mp.fmt(lp, np) if attr == "fmt" else mp.esc(lp, np)
-        )
+        """Appends the separator to a part's rendered string 's', unless
+        smart punctuation fixing says the next part should follow directly."""
 
         if fix_punc:
+            # Read the Part slots directly; this runs once per part
+            m = mp.s
+            n = np.s if np else ""
+
             # next char is empty
-            if not np or not np.pln:
+            if not n:
                 return s
 
             # current char is empty
-            if not mp.pln:
+            if not m:
                 return s
 
             # next or last char is newline
-            if np.pln.startswith(os.linesep) or mp.pln.endswith(os.linesep):
+            if n.startswith(_LINESEP) or m.endswith(_LINESEP):
                 return s
 
             # next char is punctuation and affects the separator
-            if np.pln[0] in PUNC and (len(np.pln) == 1 or np.pln[1] == " "):
+            if n[0] in _PUNC_SET and (len(n) == 1 or n[1] == " "):
                 return s
 
         return f"{s}{self._get_sep(mp, np, sep)}"
@@ -223,14 +268,44 @@ class Tinta(metaclass=_MetaTinta):
         if not self._parts:
             return ""
 
-        attr: StringType = "pln" if plaintext else "esc" if escape_ansi else "fmt"
-
-        return "".join(
-            [
-                self._get_str(attr, lp, p, np, sep, fix_punctuation)
-                for lp, p, np in self._parts_tuple
-            ]
-        )
+        if plaintext:
+            return self._to_str_pln(sep, fix_punctuation)
+        if escape_ansi:
+            return self._to_str_esc(sep, fix_punctuation)
+
+        # Without any formatting, the rich text string is just the plaintext
+        if not self.has_formatting:
+            return self._to_str_pln(sep, fix_punctuation)
+        return self._to_str_fmt(sep, fix_punctuation)
+
+    def _to_str_pln(self, sep: Optional[str], fix_punc: bool) -> str:
+        """Joins the plaintext of all parts."""
+
+        # Build a list rather than feeding join a generator (join would
+        # materialise it anyway), and bind the per-part helper once.
+        get_str = self._get_str
+        return "".join([
+            get_str(p.s, p, np, sep, fix_punc) for _, p, np in self._parts_tuple
+        ])
+
+    def _to_str_fmt(self, sep: Optional[str], fix_punc: bool) -> str:
+        """Joins the ANSI-formatted text of all parts."""
+
+        get_str = self._get_str
+        return "".join([
+            get_str(p.fmt(lp, np), p, np, sep, fix_punc)
+            for lp, p, np in self._parts_tuple
+        ])
+
+    def _to_str_esc(self, sep: Optional[str], fix_punc: bool) -> str:
+        """Joins the escaped ANSI-formatted text of each part. Separators are
+        added as-is, rather than escaped."""
+
+        get_str = self._get_str
+        return "".join([
+            get_str(p.esc(lp, np), p, np, sep, fix_punc)
+            for lp, p, np in self._parts_tuple
+        ])
 
     @property
     def color(self) -> str:
@@ -280,17 +355,21 @@ class Tinta(metaclass=_MetaTinta):
         return self._parts
 
     @property
-    def _parts_tuple(self):
-
-        for i, p in enumerate(self._parts):
-            lp = self._parts[i - 1] if i > 0 else None
-            np = self._parts[i + 1] if i < len(self._parts) - 1 else None
-            yield lp, p, np
+    def _parts_tuple(
+        self,
+    ) -> Iterator[Tuple[Optional["Tinta.Part"], "Tinta.Part", Optional["Tinta.Part"]]]:
+        """Yields each part along with its previous and next parts (or None)."""
+        parts = self._parts
+        return zip([None, *parts[:-1]], parts, [*parts[1:], None])
 
     @property
     def current_part(self) -> "Tinta.Part":
         if not self._parts:
-            self._parts.append(Tinta.Part("", Tinta.Styler(), sep=SEP))
+            # A snapshot of the current style, since push() may reuse the
+            # last part's styler as-is
+            styler = self._styler.copy()
+            self._styler._dirty = False
+            self._parts.append(Tinta.Part("", styler, sep=SEP))
         return self._parts[-1]
 
     @property
@@ -299,7 +378,7 @@ class Tinta(metaclass=_MetaTinta):
 
         Returns:
             bool: True if any part has formatting."""
-        return bool(next((p.has_formatting for p in self._parts), False))
+        return any(p.has_formatting for p in self._parts)
 
     @property
     def parts_fmt(self) -> list:
@@ -349,7 +428,14 @@ class Tinta(metaclass=_MetaTinta):
             sep = SEP
 
         # Join all s parts with the specified separator
-        pln = "" if not s else sep.join([str(x) for x in s])
+        if not s:
+            pln = ""
+        elif len(s) == 1:
+            pln = s[0] if type(s[0]) is str else str(s[0])
+        elif all(type(x) is str for x in s):
+            pln = sep.join(s)
+        else:
+            pln = sep.join(map(str, s))
 
         # Collect any prefixes that may have been set
         if self._prefixes:
@@ -358,17 +444,29 @@ class Tinta(metaclass=_MetaTinta):
 
         # TODO: Add support for background colors
 
-        # If the current part's string is not empty, add a new part
-        if self.current_part.s:
-            self._parts.append(Tinta.Part(pln, self._styler.copy(), sep=sep))
+        parts = self._parts
+        current = self._styler
+
+        # Parts never mutate their styler, so if nothing has changed since
+        # the last push, the last part's styler can be shared as-is
+        if current._dirty or not parts:
+            styler = current.copy()
+            current._dirty = False
+        else:
+            styler = parts[-1].styler
+
+        # If there is no current part, or its string is not empty, add a new part
+        if not parts or parts[-1].s:
+            parts.append(Tinta.Part(pln, styler, sep=sep))
 
         # Otherwise, update the current part with additional styles and current string
-        elif not self.current_part.s:
-            self.current_part.s = pln
-            self.current_part.styler = self._styler.copy()
-            self.current_part.sep = sep
+        else:
+            part = parts[-1]
+            part.s = pln
+            part.styler = styler
+            part.sep = sep
 
-        self._styler.force_clear = False
+        current.force_clear = False
 
         return self
 
@@ -381,8 +479,9 @@ class Tinta(metaclass=_MetaTinta):
         Returns:
             self
         """
-        for _ in range(min(qty, len(self._parts))):
-            self._parts.pop()
+        n = min(qty, len(self._parts))
+        if n > 0:
+            del self._parts[-n:]
         self._styler = self._parts[-1].styler.copy() if self._parts else Tinta.Styler()
         return self
 
@@ -466,9 +565,7 @@ class Tinta(metaclass=_MetaTinta):
         self.push(*s, sep=sep)
         return self
 
-    @copy_kwargs(bold)
-    def b(self, *args, **kwargs):
-        return self.bold(*args, **kwargs)
+    b = bold
 
     def underline(self, *s: Any, sep: str = SEP) -> "Tinta":
         """Adds underline segments to this Tinta instance
@@ -484,13 +581,8 @@ class Tinta(metaclass=_MetaTinta):
         self.push(*s, sep=sep)
         return self
 
-    @copy_kwargs(underline)
-    def u(self, *args, **kwargs):
-        return self.underline(*args, **kwargs)
-
-    @copy_kwargs(underline)
-    def _(self, *args, **kwargs):
-        return self.underline(*args, **kwargs)
+    u = underline
+    _ = underline
 
     def strikethrough(self, *s: Any, sep: str = SEP) -> "Tinta":
         """Adds strikethrough segments to this Tinta instance
@@ -576,7 +668,7 @@ class Tinta(metaclass=_MetaTinta):
         Returns:
             self
         """
-        self._prefixes = [os.linesep]
+        self._prefixes = [_LINESEP]
         self.push(*s, sep=sep)
         return self
 
@@ -606,24 +698,28 @@ class Tinta(metaclass=_MetaTinta):
             plaintext (bool, optional): Prints in plaintext. Defaults to False.
             force (bool, option): Forces printing, overriding TINTA_STEALTH.
         """
-        # We don't print if the TINTA_STEALTH env is set
-        if STEALTH and not force:
-            return
-
-        use_plaintext = True if plaintext or PREFER_PLAINTEXT else False
-        s = self.to_str(sep=sep, plaintext=use_plaintext)
-        # if s.strip() does not end with reset, add it after the last non-whitespace character
-        if not use_plaintext:
-            s = ensure_reset(s)
-        print(
-            self.to_str(sep=sep, plaintext=use_plaintext),
-            end=end,
-            file=file,
-            flush=flush,
-        )
-
-        self.clear()
-        self._parts = []
+        # Like builtin print(), there is nowhere to write when sys.stdout is
+        # None (e.g. pythonw); the default 'file' was bound to it at import.
+        out = sys.stdout if file is None else file
+
+        # We don't print (or even render) if the TINTA_STEALTH env is set or
+        # there is no output stream, but still clear below so a reused
+        # instance doesn't accumulate parts
+        if out is not None and (not STEALTH or force):
+            # No need to scan for a trailing reset: stylize() always closes the
+            # last formatted part with a full reset, before any trailing whitespace.
+            s = self.to_str(sep=sep, plaintext=bool(plaintext or PREFER_PLAINTEXT))
+
+            # One write per print, rather than print()'s separate write for 'end'
+            out.write(s + ("\n" if end is None else end))
+            if flush:
+                out.flush()
+
+        # Reset in place rather than via clear(), which would push an empty
+        # part only to throw it away, and reuse the same parts list
+        self._styler.clear_all()
+        self._prefixes.clear()
+        self._parts.clear()
 
     def __getattr__(self, name: str) -> "Tinta":
         """Returns a tinted segment of text.
@@ -635,22 +731,26 @@ class Tinta(metaclass=_MetaTinta):
             Tinta: A Tinta instance.
         """
 
-        if not name.startswith("_"):
-            # if hasattr(self.colors, name):
-            #     return cast("Tinta", self.tint(color=name))
+        # Python only calls __getattr__ once normal lookup has failed, so
+        # there is no point in retrying __getattribute__ here.
+        if name.startswith("_"):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
 
-            # else:
-            try:
-                return self.__getattribute__(name)  # type: ignore
-            except AttributeError as e:
-                known_colors = "\n - ".join(self._colors.color_list)
-                known_colors = f" - {known_colors}"
-                raise AttributeError(
-                    f"'{name}' not found.\nDid you try and access a color \
-                    that doesn't exist? Available colors:\n{known_colors}\n"
-                ) from e
+        if name in Tinta._colors.color_dict:
+            # The same method _check_colors installs, bound to this instance
+            return _color_method(name).__get__(self)  # type: ignore
 
-        return self.__getattribute__(name)  # type: ignore
+        raise AttributeError(self._format_missing_color_error(name))
+
+    def _format_missing_color_error(self, name: str) -> str:
+        """Builds the (long) error message for an unknown color attribute."""
+        known_colors = "\n - ".join(Tinta._colors.color_list)
+        return (
+            f"'{name}' not found.\nDid you try and access a color "
+            f"that doesn't exist? Available colors:\n - {known_colors}\n"
+        )
 
     @staticmethod
     def discover(background=False):
@@ -663,8 +763,7 @@ class Tinta(metaclass=_MetaTinta):
         """Clears the current printed line."""
 
         if sys.stdout:
-            sys.stdout.write(CURSOR_UP_ONE)
-            sys.stdout.write(ERASE_LINE)
+            sys.stdout.write(_CLEARLINE)
             sys.stdout.flush()
 
     @staticmethod
@@ -678,18 +777,13 @@ class Tinta(metaclass=_MetaTinta):
     class Styler:
         """A class to hold format and style config for a Tinta part."""
 
-        color: str = "default"
-        color_code: int = 0
-        bold: bool = False
-        dim: bool = False
-        italic: bool = False
-        underline: bool = False
-        blink: bool = False
-        rapid_blink: bool = False
-        invert: bool = False
-        conceal: bool = False
-        strikethrough: bool = False
-        force_clear: bool = False
+        __slots__ = ("color", "color_code", "force_clear", "_styles", "_dirty")
+
+        color: str
+        color_code: int
+        force_clear: bool
+        _styles: int  # Bitmask of active styles, see _STYLE_BITS
+        _dirty: bool
 
         def __init__(
             self,
@@ -699,6 +793,7 @@ class Tinta(metaclass=_MetaTinta):
             force_clear=False,
         ):
 
+            self._styles = 0
             self.set_color(color)
             self.set_styles(styles)
             self.force_clear = force_clear
@@ -717,79 +812,80 @@ class Tinta(metaclass=_MetaTinta):
         def __eq__(self, other):
             if not isinstance(other, Tinta.Styler):
                 return False
-            return (
-                self.color == other.color and self.active_styles == other.active_styles
-            )
+            return self.color == other.color and self._styles == other._styles
 
         def copy(self):
             new = self.__new__(self.__class__)
             new.color = self.color
             new.color_code = self.color_code
-            for k in ANSI_STYLES:
-                setattr(new, k, getattr(self, k))
+            new._styles = self._styles
+            new.force_clear = False
+            new._dirty = True
             return new
 
+        def _key(self) -> Tuple[int, int]:
+            """A hashable snapshot of the color and styles, used to cache ANSI codes."""
+            return self.color_code, self._styles
+
         @property
         def active_styles(self) -> List[str]:
             """Returns a list of active styles."""
-            return [st for st in ANSI_STYLES if getattr(self, st, None)]
+            return _style_names(self._styles)
 
         @property
         def inactive_styles(self) -> List[str]:
             """Returns a list of inactive styles."""
-            return [st for st in ANSI_STYLES if not getattr(self, st, None)]
+            return [st for st, bit in _STYLE_BITS.items() if not self._styles & bit]
 
         def set_color(self, color: Union[str, int]):
 
-            if isinstance(color, str):
-                code = Tinta._colors.get(color)
-                self.color = (
-                    Tinta._colors.reverse_get(code, ignore_errors=True)
-                    if is_ansi_str(color)
-                    else color
-                )
-                self.color_code = code
+            self._dirty = True
+            colors = Tinta._colors
+            if not isinstance(color, str):
+                self.color = colors.reverse_get(color, ignore_errors=True)
+                # color=None means no color; keep the code an int, which the
+                # (optionally compiled) stylize module relies on
+                self.color_code = color or 0
+            elif is_ansi_str(color):
+                self.color_code = colors.get(color)
+                self.color = colors.reverse_get(self.color_code, ignore_errors=True)
             else:
-                self.color = Tinta._colors.reverse_get(color, ignore_errors=True)
-                self.color_code = color
+                # A palette name (or 'default'), by far the most common case
+                self.color_code = colors.get(color)
+                self.color = color
 
         def set_styles(self, styles: Union[Sequence[str], Sequence[int]]):
 
-            from .stylize import validate_styles
-
             styles = validate_styles(*styles)
 
+            self._dirty = True
             for k in styles:
-                setattr(self, k, True)
+                self._styles |= _STYLE_BITS[k]
 
         def enable_styles(self, *styles: str):
-            from .stylize import validate_styles
-
             styles = validate_styles(*styles)
+            self._dirty = True
             for style in styles:
-                setattr(self, style, True)
+                self._styles |= _STYLE_BITS[style]
 
         def disable_styles(self, *styles: str):
-            from .stylize import validate_styles
-
             styles = validate_styles(*styles)
+            self._dirty = True
             for style in styles:
-                setattr(self, style, False)
+                self._styles &= ~_STYLE_BITS[style]
 
         def toggle_styles(self, *styles: str):
-            from .stylize import validate_styles
-
             styles = validate_styles(*styles)
+            self._dirty = True
             for style in styles:
-                setattr(self, style, not getattr(self, style))
+                self._styles ^= _STYLE_BITS[style]
 
         def clear_styles(self):
-            for k in ANSI_STYLES:
-                setattr(self, k, False)
+            self._dirty = True
+            self._styles = 0
 
         def clear_all(self, force: bool = False):
-            for k in ANSI_STYLES:
-                setattr(self, k, False)
+            self._styles = 0
             self.set_color(0)
             self.force_clear = force
 
@@ -803,6 +899,8 @@ class Tinta(metaclass=_MetaTinta):
             sep (str):                  Used to join segment strings. Defaults to ' '.
         """
 
+        __slots__ = ("s", "styler", "sep")
+
         def __init__(
             self,
             s: str,
@@ -826,7 +924,7 @@ class Tinta(metaclass=_MetaTinta):
 
         @property
         def has_formatting(self):
-            return bool(self.styler.active_styles or self.styler.color_code)
+            return bool(self.styler._styles or self.styler.color_code)
 
         @property
         def color(self):
@@ -844,36 +942,45 @@ class Tinta(metaclass=_MetaTinta):
         def pln(self):
             return self.s
 
-        def fmt(self, lp: "Optional[Tinta.Part]", np: "Optional[Tinta.Part]"):
+        def fmt(self, lp: "Optional[Tinta.Part]", np: "Optional[Tinta.Part]") -> str:
             return stylize(self.s, lp, self, np)
 
-        def esc(self, lp: "Optional[Tinta.Part]", np: "Optional[Tinta.Part]"):
+        def esc(self, lp: "Optional[Tinta.Part]", np: "Optional[Tinta.Part]") -> str:
             return esc(self.fmt(lp, np))
 
     @staticmethod
     def strip_ansi(s: str) -> str:
         """A utility method that strips ANSI escape codes from a string, converting a styled string into plaintext."""
-        return re.sub(
-            r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])", "", s, re.I | re.M | re.U
-        )
+        return _strip_ansi(s)
 
     @classmethod
     def ljust(cls, s: str, width: int, fillchar: str = " ") -> str:
         """Returns a string left justified in a field of a specified width, accounting for ansi formatting."""
-        chars_to_add = width - len(cls.strip_ansi(s))
+        chars_to_add = width - len(_strip_ansi(s))
         return f"{s}{str(fillchar or '') * chars_to_add}"
 
     @classmethod
     def rjust(cls, s: str, width: int, fillchar: str = " ") -> str:
         """Returns a string right justified in a field of a specified width, accounting for ansi formatting."""
-        chars_to_add = width - len(cls.strip_ansi(s))
+        chars_to_add = width - len(_strip_ansi(s))
         return f"{str(fillchar or '') * chars_to_add}{s}"
 
 
+def _strip_ansi(s: str) -> str:
+    # Every sequence starts with ESC, so plain strings can skip the regex
+    return _ANSI_RE.sub("", s) if "\x1b" in s else s
+
+
 def esc(string: str, replace: bool = False) -> str:
     """Returns the raw representation of a string. If replace is true,
     replace a double backslash with a single backslash."""
-    r = repr(string)[1:-1]  # Strip the quotes from representation
+    r = string.translate(_ESC_TABLE)
+
+    # The table only covers ASCII/C1 controls. Anything else repr() would
+    # escape (e.g. NBSP, zero-width space), or a string that needs repr()'s
+    # quote escaping, goes through repr() itself.
+    if not r.isprintable() or ("'" in string and '"' in string):
+        r = repr(string)[1:-1]
     if replace:
         r = r.replace("\\\\", "\\")
     return r
@@ -12,12 +12,9 @@
 # If you use this software, you must also agree under the terms of the Hippocratic License 3.0 to not use this software in a way that directly or indirectly causes harm. You can find the full text of the license at https://firstdonoharm.dev.
 
 """This module contains type hints and utility functions for Tinta."""
-import functools
-from typing import Any, Callable, cast
+from typing import Any
 
-from .multi_version_imports import GenericCallable, Literal
-
-StringType = Literal["pln", "esc", "fmt"]  # type: ignore
+_TRUTHY = frozenset(("true", "1", "t", "y", "yes"))
 
 
 class MissingColorError(Exception):
@@ -38,23 +35,8 @@ class InvalidColorError(Exception):
     ...
 
 
-def copy_kwargs(func: GenericCallable) -> Callable[..., GenericCallable]:
-    """Decorator does nothing but casts the original function to match the given function signature"""
-
-    @functools.wraps(func, updated=())
-    def _cast_func(_func: Callable[..., Any]) -> GenericCallable:
-        return cast(GenericCallable, _func)
-
-    if not callable(func):
-        raise RuntimeError(
-            f"You must pass a function to this decorator, got {func} instead."
-        )
-
-    return _cast_func
-
-
 def parse_bool(value: Any) -> bool:
     """Parses a string value to a boolean value."""
     if isinstance(value, bool):
         return value
-    return str(value).lower() in ("true", "1", "t", "y", "yes")
+    return str(value).lower() in _TRUTHY
@@ -1,4 +1,4 @@
-from functools import reduce
+from itertools import chain
 from typing import cast, List, Sequence
 
 from .multi_version_imports import TypeVar
@@ -15,7 +15,7 @@ def flatmap(lst: Sequence[List[T]]) -> List[T]:
     if not any(isinstance(i, list) for i in lst):
         return cast(List[T], lst)
 
-    return reduce(list.__add__, lst)
+    return list(chain.from_iterable(lst))
 
 
 INDENT = 0